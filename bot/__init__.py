@@ -6,10 +6,10 @@ import sys
 from logging import StreamHandler, FileHandler
 
 
-BASE_DIR = os.path.normpath(os.path.dirname(os.path.realpath(__file__)))
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 handler_console = StreamHandler(stream=sys.stdout)
 handler_console.setLevel(logging.DEBUG)
-handler_filestream = FileHandler(filename=f"{BASE_DIR}/bot.log", encoding='utf-8')
+handler_filestream = FileHandler(filename=os.path.join(BASE_DIR, "bot.log"), encoding='utf-8')
 handler_filestream.setLevel(logging.INFO)
 
 logging_handlers = [
@@ -17,8 +17,15 @@ logging_handlers = [
         handler_filestream
 ]
 
+# None of these are in the format, so skip collecting them for every record. Clearing _srcfile stops
+# logging from walking the call stack (sys._getframe) to find the calling function.
+logging._srcfile = None
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 logging.basicConfig(
-    format="%(asctime)s | %(name)25s | %(funcName)25s | %(levelname)6s | %(message)s",
+    format="%(asctime)s | %(name)25s | %(levelname)6s | %(message)s",
     datefmt="%b %d %H:%M:%S",
     level=logging.DEBUG,
     handlers=logging_handlers
@@ -5,6 +5,15 @@ import asyncio
 import logging
 import dotenv
 
+try:
+    # uvloop (or winloop on Windows) is a drop-in, faster replacement for the default asyncio event loop
+    import uvloop as fast_loop
+except ImportError:
+    try:
+        import winloop as fast_loop
+    except ImportError:
+        fast_loop = None
+
 dotenv.load_dotenv()
 log = logging.getLogger(__name__)
 
@@ -14,43 +23,59 @@ extensions = (
 )
 
 
+# Gateway intents the bot needs. Built once and reused for every Bot instance.
+_INTENTS = discord.Intents(messages=True, guilds=True)
+
+# Required environment variables as (name, description, type)
+_ENV_SPEC = (
+    ('TOKEN', 'The Bot Token', str),
+)
+
+
 class MissingConfigurationException(Exception):
     pass
 
 
 def assert_envs_exist():
-    envs = (
-        ('TOKEN', 'The Bot Token', str),
-    )
-    for e in envs:
-        ident = f"{e[0]}/{e[1]}"
-        value = os.environ.get(e[0])
-        if value is None:
-            raise MissingConfigurationException(f"{ident} needs to be- defined")
+    for name, description, type_ in _ENV_SPEC:
         try:
-            _ = e[2](value)
+            _ = type_(os.environ[name])
+        except KeyError:
+            raise MissingConfigurationException(f"{name}/{description} needs to be defined") from None
         except ValueError:
-            raise MissingConfigurationException(f"{ident} is not the required type of {e[2]}")
+            raise MissingConfigurationException(f"{name}/{description} is not the required type of {type_}") from None
 
 
 async def run_bot():
     assert_envs_exist()
     token = os.environ['TOKEN']
-    intents = discord.Intents.none()
-    intents.messages = True
-    intents.guilds = True
     bot = commands.Bot(
-        intents=intents,
+        intents=_INTENTS,
         command_prefix=commands.when_mentioned,
         slash_commands=True,
     )
-    try:
-        for ext in extensions:
-            await bot.load_extension(ext)
-            log.debug(f"Extension {ext} loaded")
+
+    async def cache_prefix():
+        # The mention prefixes only depend on the bot user, so build them once instead of on every message
+        bot.command_prefix = (f'<@{bot.user.id}> ', f'<@!{bot.user.id}> ')
+
+    bot.add_listener(cache_prefix, 'on_ready')
+
+    async def load(ext: str):
+        await bot.load_extension(ext)
+        log.debug("Extension %s loaded", ext)
+
+    async with bot:
+        # Load the extensions concurrently. A failing extension is logged and doesn't stop the others from loading
+        results = await asyncio.gather(*(load(ext) for ext in extensions), return_exceptions=True)
+        for ext, result in zip(extensions, results):
+            if isinstance(result, BaseException):
+                log.error("Extension %s failed to load", ext, exc_info=result)
 
         await bot.start(token)
-    finally:
-        await bot.close()
 
-asyncio.run(run_bot())
+
+if __name__ == '__main__':
+    if fast_loop is not None:
+        fast_loop.install()
+    asyncio.run(run_bot())
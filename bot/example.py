@@ -3,8 +3,16 @@ from discord import app_commands
 from discord import ui
 from discord.ext import commands
 
-# Create Select options. This is a List of SelectOption. I just use a list comprehension here to make it easier
-SELECT_OPTIONS = [discord.SelectOption(label=f"Value{x}", value=f"Value{x}") for x in range(1, 4)]
+# Create Select options. This is a tuple of SelectOption. It is built once and the same object is handed to the select
+# of every view, so it is kept immutable.
+SELECT_OPTIONS = tuple(discord.SelectOption(label=f"Value{x}", value=f"Value{x}") for x in range(1, 4))
+
+# The name and style of each button the view shows once an option is selected
+BUTTON_SPECS = (
+    ("Button1", discord.ButtonStyle.red),
+    ("Button2", discord.ButtonStyle.green),
+    ("Button3", discord.ButtonStyle.blurple),
+)
 
 
 def make_embed(text: str):
@@ -22,6 +30,8 @@ class MyModal(ui.Modal, title="Enter a value"):
     it there.
 
     """
+    __slots__ = ('view',)
+
     def __init__(self, view: 'ComponentView', **kwargs):
         super().__init__(**kwargs)
         self.view = view
@@ -30,8 +40,8 @@ class MyModal(ui.Modal, title="Enter a value"):
 
     async def on_submit(self, interaction: discord.Interaction):
         value = self.text_value.value
-        # Append to the text line.
-        self.view.text += f"\n Modal was called and value entered is {value}"
+        # Append to the text lines.
+        self.view.add_line(f"Modal was called and value entered is {value}")
         await interaction.response.edit_message(embed=make_embed(self.view.text), view=self.view)
 
 
@@ -43,6 +53,7 @@ class MyButton(ui.Button):
     Likewise all buttons act the same where it updates the text of a view and calls a modal (a way to get input).
     So we can utilize subclassing to not have to duplicate code.
     """
+    __slots__ = ('name',)
 
     def __init__(self, name: str, **kwargs):
         super().__init__(label=name, **kwargs)
@@ -51,7 +62,7 @@ class MyButton(ui.Button):
     async def callback(self, interaction: discord.Interaction):
         # For most editor type inference and autocomplete support
         view: ComponentView = self.view
-        view.text += f"\n {self.name} was pressed!"
+        view.add_line(f"{self.name} was pressed!")
         await interaction.response.send_modal(MyModal(self.view))
 
 
@@ -63,36 +74,43 @@ class ComponentView(ui.View):
     # since you must create the message with the view first. This allows us to attach it later.
     message: discord.Message
 
+    # The discord.py base classes still carry a __dict__, but our own attributes get faster slot access.
+    __slots__ = ('_lines', 'buttons', 'message')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.text = ""
+        # The lines of text are only joined together when the embed is rendered
+        self._lines: list[str] = []
 
-        # create and hold a reference, but don't add them to the view. Once added to a view they "appear".
-        self.button1 = MyButton("Button1", style=discord.ButtonStyle.red)
-        self.button2 = MyButton("Button2", style=discord.ButtonStyle.green)
-        self.button3 = MyButton("Button3", style=discord.ButtonStyle.blurple)
+        # The buttons are only created once an option is selected, since many views are never interacted with.
+        # We hold a reference to them, and once added to a view they "appear".
+        self.buttons: tuple[MyButton, ...] = ()
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self._lines)
+
+    def add_line(self, line: str):
+        """Appends a line to the text shown in the embed"""
+        self._lines.append(line)
 
     @ui.select(options=SELECT_OPTIONS)
     async def dropdown_selected(self, interaction: discord.Interaction, select: ui.Select):
         """Dropdown was selected. Set the flag to display the buttons and update the text"""
 
         # Make each select option comma separated for text
-        values = ', '.join([v for v in select.values])
+        values = ', '.join(select.values)
 
         # This is the beginning of the chain so reset the entire text field and update
-        self.text = f"{values} selected in select option"
+        self._lines = [f"{values} selected in select option"]
 
-        # Add the referenced buttons to the view if they aren't in it already
-        self.add_button_to_view(self.button1)
-        self.add_button_to_view(self.button2)
-        self.add_button_to_view(self.button3)
+        # Create the buttons and add them to the view the first time an option is selected
+        if not self.buttons:
+            self.buttons = tuple(MyButton(name, style=style) for name, style in BUTTON_SPECS)
+            for button in self.buttons:
+                self.add_item(button)
         await interaction.response.edit_message(embed=make_embed(self.text), view=self)
 
-    def add_button_to_view(self, button: MyButton):
-        """Helper function to make sure we don't re-add the same item to the view"""
-        if button not in self.children:
-            self.add_item(button)
-
 
 class ExampleCog(commands.Cog):
     def __init__(self, bot):